@@ -1,7 +1,19 @@
+import sys
 from datetime import datetime
-from typing import Any, Literal
-
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, Any, Literal
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    GetJsonSchemaHandler,
+    SkipValidation,
+    Tag,
+    field_validator,
+)
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema
 
 from pagerduty_mcp.models.base import MAX_RESULTS
 from pagerduty_mcp.models.references import ServiceReference, UserReference
@@ -24,17 +36,48 @@ LogEntryType = Literal[
 
 TimeZone = Literal["UTC"]
 
+IncludeOption = Literal["incidents", "services", "channels", "teams"]
+
+_BOOL_STR = {True: "true", False: "false"}
+
+
+def _agent_type(value: Any) -> str:
+    agent_type = value.get("type") if isinstance(value, dict) else getattr(value, "type", None)
+    # Anything that is not a service (e.g. integrations) keeps being treated as a user reference
+    return "service_reference" if agent_type == "service_reference" else "user_reference"
+
+
+class _AnyOfJsonSchema:
+    """Publish a tagged union as anyOf instead of oneOf.
+
+    The user and service reference schemas are identical (type is a computed field), so every
+    agent matches both branches and oneOf would reject it when clients validate tool output.
+    """
+
+    def __get_pydantic_json_schema__(self, core_schema: CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        json_schema = handler(core_schema)
+        if "oneOf" in json_schema:
+            json_schema["anyOf"] = json_schema.pop("oneOf")
+        return json_schema
+
+
+AgentReference = Annotated[
+    Annotated[UserReference, Tag("user_reference")] | Annotated[ServiceReference, Tag("service_reference")],
+    Discriminator(_agent_type),
+    _AnyOfJsonSchema(),
+]
+
 
 class IncidentReference(BaseModel):
     """Reference to an incident."""
 
-    id: str = Field(description="The ID of the incident")
-    type: Literal["incident_reference"] = Field(
-        default="incident_reference", description="The type of reference"
-    )
-    summary: str | None = Field(default=None, description="A short summary of the incident")
-    self: str | None = Field(default=None, description="API URL for the incident")
-    html_url: str | None = Field(default=None, description="Web URL for the incident")
+    model_config = ConfigDict(defer_build=True)
+
+    id: str
+    type: Literal["incident_reference"] = "incident_reference"
+    summary: str | None = None
+    self: str | None = None
+    html_url: str | None = None
 
 
 class ChannelReference(BaseModel):
@@ -53,6 +96,8 @@ class ChannelReference(BaseModel):
     It means alerts stopped firing (likely because engineers fixed the issue).
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     type: str = Field(
         description=(
             "The type of channel. "
@@ -66,6 +111,12 @@ class ChannelReference(BaseModel):
         description="Summary or additional details about the channel (e.g., 'View in Alertmanager' for API integrations)"
     )
 
+    @field_validator("type", mode="before")
+    @classmethod
+    def _intern_type(cls, value: Any):
+        # Only a handful of channel types exist, so share one string per type across entries
+        return sys.intern(value) if isinstance(value, str) else value
+
 
 class LogEntry(BaseModel):
     """A log entry representing an action taken on an incident.
@@ -76,7 +127,7 @@ class LogEntry(BaseModel):
     available through the regular incident API.
     """
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = Field(description="The ID of the log entry")
     type: LogEntryType = Field(description="The type of log entry")
@@ -84,7 +135,7 @@ class LogEntry(BaseModel):
     self: str = Field(description="The API URL for this log entry")
     html_url: str | None = Field(default=None, description="The web URL for this log entry")
     created_at: datetime = Field(description="When the log entry was created")
-    agent: UserReference | ServiceReference | None = Field(
+    agent: AgentReference | None = Field(
         default=None,
         description="The agent (user or service) that performed the action. "
         "For resolve_log_entry, this is the user who resolved the incident. "
@@ -104,13 +155,14 @@ class LogEntry(BaseModel):
     )
     service: ServiceReference | None = Field(default=None, description="The service associated with the log entry")
     incident: IncidentReference = Field(description="The incident this log entry is associated with")
-    teams: list[dict[str, Any]] | None = Field(
+    # Opaque pass-through payloads: nothing reads into them, so skip walking them during validation
+    teams: SkipValidation[list[dict[str, Any]] | None] = Field(
         default=None, description="Teams associated with the incident at the time of the log entry"
     )
-    contexts: list[dict[str, Any]] | None = Field(
+    contexts: SkipValidation[list[dict[str, Any]] | None] = Field(
         default=None, description="Additional context for the log entry"
     )
-    event_details: dict[str, Any] | None = Field(
+    event_details: SkipValidation[dict[str, Any] | None] = Field(
         default=None, description="Additional event details (structure varies by log entry type)"
     )
 
@@ -118,7 +170,7 @@ class LogEntry(BaseModel):
 class LogEntryQuery(BaseModel):
     """Query parameters for listing log entries."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     since: datetime | None = Field(
         default=None, description="Filter log entries that occurred after this time"
@@ -134,7 +186,7 @@ class LogEntryQuery(BaseModel):
         default=False,
         description="If true, only log entries of type triggers, acknowledges, and resolves are returned",
     )
-    include: list[Literal["incidents", "services", "channels", "teams"]] | None = Field(
+    include: list[IncludeOption] | None = Field(
         default=None,
         description="Array of additional details to include (incidents, services, channels, teams)",
     )
@@ -147,11 +199,11 @@ class LogEntryQuery(BaseModel):
 
     def to_params(self) -> dict[str, Any]:
         """Convert query model to API parameters."""
-        params = {"time_zone": self.time_zone, "is_overview": str(self.is_overview).lower()}
+        params: dict[str, Any] = {"time_zone": self.time_zone, "is_overview": _BOOL_STR[self.is_overview]}
 
-        if self.since:
+        if self.since is not None:
             params["since"] = self.since.isoformat()
-        if self.until:
+        if self.until is not None:
             params["until"] = self.until.isoformat()
         if self.include:
             params["include[]"] = self.include
@@ -161,47 +213,5 @@ class LogEntryQuery(BaseModel):
         return params
 
 
-class IncidentLogEntryQuery(BaseModel):
-    """Query parameters for listing log entries for a specific incident."""
-
-    model_config = ConfigDict(extra="forbid")
-
-    since: datetime | None = Field(
-        default=None, description="Filter log entries that occurred after this time"
-    )
-    until: datetime | None = Field(
-        default=None, description="Filter log entries that occurred before this time"
-    )
-    time_zone: TimeZone = Field(
-        default="UTC",
-        description="Time zone for the time window. Currently only UTC is supported.",
-    )
-    is_overview: bool = Field(
-        default=False,
-        description="If true, only log entries of type triggers, acknowledges, and resolves are returned",
-    )
-    include: list[Literal["incidents", "services", "channels", "teams"]] | None = Field(
-        default=None,
-        description="Array of additional details to include (incidents, services, channels, teams)",
-    )
-    limit: int | None = Field(
-        ge=1,
-        le=MAX_RESULTS,
-        default=100,
-        description="Maximum number of results to return. The maximum is 1000",
-    )
-
-    def to_params(self) -> dict[str, Any]:
-        """Convert query model to API parameters."""
-        params = {"time_zone": self.time_zone, "is_overview": str(self.is_overview).lower()}
-
-        if self.since:
-            params["since"] = self.since.isoformat()
-        if self.until:
-            params["until"] = self.until.isoformat()
-        if self.include:
-            params["include[]"] = self.include
-        if self.limit:
-            params["limit"] = self.limit
-
-        return params
+# Incident-scoped listing accepts exactly the same parameters
+IncidentLogEntryQuery = LogEntryQuery
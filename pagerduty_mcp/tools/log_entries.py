@@ -1,3 +1,5 @@
+from pydantic import ConfigDict, TypeAdapter
+
 from pagerduty_mcp.client import get_client
 from pagerduty_mcp.models import (
     IncidentLogEntryQuery,
@@ -5,7 +7,22 @@ from pagerduty_mcp.models import (
     LogEntry,
     LogEntryQuery,
 )
-from pagerduty_mcp.utils import paginate
+from pagerduty_mcp.utils import paginate_iter
+
+_LOG_ENTRY_LIST_ADAPTER = TypeAdapter(list[LogEntry], config=ConfigDict(defer_build=True))
+
+
+def _list_log_entries(entity: str, query_model: LogEntryQuery) -> ListResponseModel[LogEntry]:
+    """Fetch and validate the log entries of a log entry index endpoint page by page."""
+    log_entries: list[LogEntry] = []
+    for page in paginate_iter(
+        client=get_client(),
+        entity=entity,
+        params=query_model.to_params(),
+        maximum_records=query_model.limit or 100,
+    ):
+        log_entries.extend(_LOG_ENTRY_LIST_ADAPTER.validate_python(page))
+    return ListResponseModel[LogEntry](response=log_entries)
 
 
 def list_log_entries(query_model: LogEntryQuery) -> ListResponseModel[LogEntry]:
@@ -38,17 +55,7 @@ def list_log_entries(query_model: LogEntryQuery) -> ListResponseModel[LogEntry]:
 
         >>> result = list_log_entries(LogEntryQuery(include=["incidents", "services"], limit=100))
     """
-    params = query_model.to_params()
-
-    response = paginate(
-        client=get_client(),
-        entity="log_entries",
-        params=params,
-        maximum_records=query_model.limit or 100,
-    )
-
-    log_entries = [LogEntry(**entry) for entry in response]
-    return ListResponseModel[LogEntry](response=log_entries)
+    return _list_log_entries("log_entries", query_model)
 
 
 def list_incident_log_entries(
@@ -117,17 +124,7 @@ def list_incident_log_entries(
         To find who resolved an incident, look for log entries with type="resolve_log_entry"
         and check the "agent" field which contains the user who performed the action.
     """
-    params = query_model.to_params()
-
-    response = paginate(
-        client=get_client(),
-        entity=f"incidents/{incident_id}/log_entries",
-        params=params,
-        maximum_records=query_model.limit or 100,
-    )
-
-    log_entries = [LogEntry(**entry) for entry in response]
-    return ListResponseModel[LogEntry](response=log_entries)
+    return _list_log_entries(f"incidents/{incident_id}/log_entries", query_model)
 
 
 def get_log_entry(log_entry_id: str) -> LogEntry:
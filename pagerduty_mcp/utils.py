@@ -1,7 +1,10 @@
+from collections.abc import Iterator
+
 from pagerduty import RestApiV2Client
 from pagerduty.errors import HttpError
 
 from pagerduty_mcp.models import MAX_RESULTS, MCPContext, User
+from pagerduty_mcp.models.base import MAXIMUM_PAGINATION_LIMIT
 
 
 def get_mcp_context(client: RestApiV2Client) -> MCPContext:
@@ -38,11 +41,43 @@ def paginate(*, client: RestApiV2Client, entity: str, params: dict, maximum_reco
     Returns:
         A list of results
     """
-    results = []
-    count = 0
-    for incident in client.iter_all(entity, params=params):
-        results.append(incident)
-        count += 1  # noqa: SIM113
+    return [
+        result
+        for page in paginate_iter(client=client, entity=entity, params=params, maximum_records=maximum_records)
+        for result in page
+    ]
+
+
+def paginate_iter(
+    *,
+    client: RestApiV2Client,
+    entity: str,
+    params: dict,
+    maximum_records: int = MAX_RESULTS,
+    page_size: int = MAXIMUM_PAGINATION_LIMIT,
+) -> Iterator[list[dict]]:
+    """Paginate results page by page.
+
+    Yields the results in lists of at most `page_size` records instead of collecting every
+    record first, so each page can be processed and released before the next one is
+    accumulated. `paginate` is built on top of this.
+
+    Args:
+        client: The PagerDuty API client
+        entity: The entity to paginate through (e.g., "incidents")
+        params: The parameters to pass to the API request
+        maximum_records: The maximum number of records to return
+        page_size: The maximum number of records in each yielded page
+    Yields:
+        Lists of results
+    """
+    page = []
+    for count, result in enumerate(client.iter_all(entity, params=params), start=1):
+        page.append(result)
+        if len(page) >= page_size:
+            yield page
+            page = []
         if count >= maximum_records:
             break
-    return results
+    if page:
+        yield page
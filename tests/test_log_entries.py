@@ -1,14 +1,22 @@
 """Unit tests for log entries tools."""
 
-import unittest
-from datetime import datetime
-from unittest.mock import Mock, patch
+from datetime import UTC, datetime
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+import jsonschema
+import pytest
+from mcp.server.fastmcp.tools import Tool
+from pydantic import ValidationError
 
 from pagerduty_mcp.models import (
     IncidentLogEntryQuery,
     ListResponseModel,
     LogEntry,
     LogEntryQuery,
+    ServiceReference,
+    UserReference,
 )
 from pagerduty_mcp.tools.log_entries import (
     get_log_entry,
@@ -16,484 +24,537 @@ from pagerduty_mcp.tools.log_entries import (
     list_log_entries,
 )
 
+SINCE_DATE = datetime(2023, 1, 1)
+UNTIL_DATE = datetime(2023, 1, 31)
+SINCE_ISO = SINCE_DATE.isoformat()
+UNTIL_ISO = UNTIL_DATE.isoformat()
+
+# Query parameters expected from a default query and from a query setting every filter.
+EXPECTED_DEFAULT_PARAMS = MappingProxyType({"time_zone": "UTC", "is_overview": "false"})
+EXPECTED_FILTERED_PARAMS = MappingProxyType(
+    {
+        "since": SINCE_ISO,
+        "until": UNTIL_ISO,
+        "is_overview": "true",
+        "include[]": ["incidents", "services"],
+        "limit": 50,
+        "time_zone": "UTC",
+    }
+)
 
-class TestLogEntriesTools(unittest.TestCase):
-    """Test cases for log entries tools."""
-
-    @classmethod
-    def setUpClass(cls):
-        """Set up test fixtures once for the entire test class."""
-        cls.sample_log_entry_data = {
-            "id": "LOGENTRY123",
-            "type": "resolve_log_entry",
-            "summary": "Resolved by User",
-            "self": "https://api.pagerduty.com/log_entries/LOGENTRY123",
-            "html_url": "https://test.pagerduty.com/log_entries/LOGENTRY123",
-            "created_at": "2023-01-01T00:00:00Z",
-            "agent": {
-                "id": "PUSER123",
-                "type": "user_reference",
-                "summary": "Test User",
-                "self": "https://api.pagerduty.com/users/PUSER123",
-            },
-            "service": {
-                "id": "PSERVICE123",
-                "type": "service_reference",
-                "summary": "Test Service",
-                "self": "https://api.pagerduty.com/services/PSERVICE123",
-            },
-            "incident": {
-                "id": "PINCIDENT123",
-                "type": "incident_reference",
-                "summary": "Test Incident",
-                "self": "https://api.pagerduty.com/incidents/PINCIDENT123",
-                "html_url": "https://test.pagerduty.com/incidents/PINCIDENT123",
-            },
-        }
-
-        cls.sample_trigger_log_entry_data = {
-            "id": "LOGENTRY456",
-            "type": "trigger_log_entry",
-            "summary": "Incident triggered",
-            "self": "https://api.pagerduty.com/log_entries/LOGENTRY456",
-            "created_at": "2023-01-01T00:00:00Z",
-            "agent": {
-                "id": "PSERVICE123",
-                "type": "service_reference",
-                "summary": "Test Service",
-                "self": "https://api.pagerduty.com/services/PSERVICE123",
-            },
-            "incident": {
-                "id": "PINCIDENT123",
-                "type": "incident_reference",
-                "summary": "Test Incident",
-                "self": "https://api.pagerduty.com/incidents/PINCIDENT123",
-            },
-        }
-
-        cls.sample_acknowledge_log_entry_data = {
-            "id": "LOGENTRY789",
-            "type": "acknowledge_log_entry",
-            "summary": "Acknowledged by User",
-            "self": "https://api.pagerduty.com/log_entries/LOGENTRY789",
-            "created_at": "2023-01-01T00:00:00Z",
-            "agent": {
-                "id": "PUSER456",
-                "type": "user_reference",
-                "summary": "Another User",
-                "self": "https://api.pagerduty.com/users/PUSER456",
-            },
-            "incident": {
-                "id": "PINCIDENT123",
-                "type": "incident_reference",
-                "summary": "Test Incident",
+
+RESOLVE_LOG_ENTRY = {
+    "id": "LOGENTRY123",
+    "type": "resolve_log_entry",
+    "summary": "Resolved by User",
+    "self": "https://api.pagerduty.com/log_entries/LOGENTRY123",
+    "html_url": "https://test.pagerduty.com/log_entries/LOGENTRY123",
+    "created_at": "2023-01-01T00:00:00Z",
+    "agent": {
+        "id": "PUSER123",
+        "type": "user_reference",
+        "summary": "Test User",
+        "self": "https://api.pagerduty.com/users/PUSER123",
+    },
+    "service": {
+        "id": "PSERVICE123",
+        "type": "service_reference",
+        "summary": "Test Service",
+        "self": "https://api.pagerduty.com/services/PSERVICE123",
+    },
+    "incident": {
+        "id": "PINCIDENT123",
+        "type": "incident_reference",
+        "summary": "Test Incident",
+        "self": "https://api.pagerduty.com/incidents/PINCIDENT123",
+        "html_url": "https://test.pagerduty.com/incidents/PINCIDENT123",
+    },
+}
+
+TRIGGER_LOG_ENTRY = {
+    "id": "LOGENTRY456",
+    "type": "trigger_log_entry",
+    "summary": "Incident triggered",
+    "self": "https://api.pagerduty.com/log_entries/LOGENTRY456",
+    "created_at": "2023-01-01T00:00:00Z",
+    "agent": {
+        "id": "PSERVICE123",
+        "type": "service_reference",
+        "summary": "Test Service",
+        "self": "https://api.pagerduty.com/services/PSERVICE123",
+    },
+    "incident": {
+        "id": "PINCIDENT123",
+        "type": "incident_reference",
+        "summary": "Test Incident",
+        "self": "https://api.pagerduty.com/incidents/PINCIDENT123",
+    },
+}
+
+ACKNOWLEDGE_LOG_ENTRY = {
+    "id": "LOGENTRY789",
+    "type": "acknowledge_log_entry",
+    "summary": "Acknowledged by User",
+    "self": "https://api.pagerduty.com/log_entries/LOGENTRY789",
+    "created_at": "2023-01-01T00:00:00Z",
+    "agent": {
+        "id": "PUSER456",
+        "type": "user_reference",
+        "summary": "Another User",
+        "self": "https://api.pagerduty.com/users/PUSER456",
+    },
+    "incident": {
+        "id": "PINCIDENT123",
+        "type": "incident_reference",
+        "summary": "Test Incident",
+    },
+}
+
+
+@pytest.fixture(scope="session")
+def parsed_log_entries():
+    """The canonical LogEntry models, validated once from the API payloads and keyed by log entry ID."""
+    return {
+        data["id"]: LogEntry.model_validate(data)
+        for data in (RESOLVE_LOG_ENTRY, TRIGGER_LOG_ENTRY, ACKNOWLEDGE_LOG_ENTRY)
+    }
+
+
+def _dump(entry: LogEntry) -> dict[str, Any]:
+    """Serialize a canonical LogEntry back into an API-style payload."""
+    return entry.model_dump(mode="json")
+
+
+@pytest.fixture(scope="session")
+def sample_trigger_log_entry_data(parsed_log_entries):
+    """Trigger log entry payload derived from its canonical model."""
+    return _dump(parsed_log_entries[TRIGGER_LOG_ENTRY["id"]])
+
+
+@pytest.fixture(scope="session")
+def sample_acknowledge_log_entry_data(parsed_log_entries):
+    """Acknowledge log entry payload derived from its canonical model."""
+    return _dump(parsed_log_entries[ACKNOWLEDGE_LOG_ENTRY["id"]])
+
+
+@pytest.fixture(scope="session")
+def default_query():
+    """Log entry query with every parameter left at its default."""
+    return LogEntryQuery()
+
+
+class _StubClient:
+    """Stand-in for the PagerDuty client that answers rget with a canned response."""
+
+    def __init__(self, ret=None, exc=None):
+        self.ret = ret
+        self.exc = exc
+        self.last_path = None
+
+    def rget(self, path):
+        self.last_path = path
+        if self.exc:
+            raise self.exc
+        return self.ret
+
+
+@pytest.fixture(autouse=True)
+def patch_client(monkeypatch):
+    """Replace the PagerDuty client and pagination used by the log entries tools.
+
+    paginate.return_value is the list of pages to return.
+    """
+    client = _StubClient()
+    paginate = Mock()
+    monkeypatch.setattr("pagerduty_mcp.tools.log_entries.get_client", lambda: client)
+    monkeypatch.setattr("pagerduty_mcp.tools.log_entries.paginate_iter", paginate)
+    return SimpleNamespace(client=client, paginate=paginate)
+
+
+def _assert_list_response(result, expected_len):
+    """Check a list tool result is a ListResponseModel of exactly expected_len LogEntry models."""
+    assert type(result) is ListResponseModel[LogEntry]
+    assert len(result.response) == expected_len
+    assert all(type(entry) is LogEntry for entry in result.response)
+
+
+# Pages handed to the mocked paginator, built once and shared by the listing matrix.
+_PAGES_BY_KEY = {
+    "empty": [],
+    "resolve": [[RESOLVE_LOG_ENTRY]],
+    "resolve_trigger_ack": [[RESOLVE_LOG_ENTRY, TRIGGER_LOG_ENTRY, ACKNOWLEDGE_LOG_ENTRY]],
+    "trigger_ack_resolve": [[TRIGGER_LOG_ENTRY, ACKNOWLEDGE_LOG_ENTRY, RESOLVE_LOG_ENTRY]],
+}
+
+
+@pytest.fixture
+def paginate_return(request):
+    """Pages for the mocked paginator, selected by key through indirect parametrization."""
+    return _PAGES_BY_KEY[request.param]
+
+
+def test_models_parse_all_samples(parsed_log_entries):
+    """Test that every sample payload parses and survives a JSON round trip."""
+    for data in (RESOLVE_LOG_ENTRY, TRIGGER_LOG_ENTRY, ACKNOWLEDGE_LOG_ENTRY):
+        entry = parsed_log_entries[data["id"]]
+        assert entry.type == data["type"]
+        assert LogEntry.model_validate(entry.model_dump(mode="json")) == entry
+
+
+@pytest.mark.parametrize(
+    ("incident_id", "query", "paginate_return", "expected_entity", "expected_params", "expected_max", "expected_types"),
+    [
+        pytest.param(
+            None,
+            LogEntryQuery(),
+            "resolve",
+            "log_entries",
+            EXPECTED_DEFAULT_PARAMS,
+            100,
+            ["resolve_log_entry"],
+            id="basic",
+        ),
+        pytest.param(
+            None,
+            LogEntryQuery(),
+            "empty",
+            "log_entries",
+            EXPECTED_DEFAULT_PARAMS,
+            100,
+            [],
+            id="empty",
+        ),
+        pytest.param(
+            None,
+            LogEntryQuery(
+                since=SINCE_DATE,
+                until=UNTIL_DATE,
+                is_overview=True,
+                include=["incidents", "services"],
+                limit=50,
+            ),
+            "resolve_trigger_ack",
+            "log_entries",
+            EXPECTED_FILTERED_PARAMS,
+            50,
+            ["resolve_log_entry", "trigger_log_entry", "acknowledge_log_entry"],
+            id="with_filters",
+        ),
+        pytest.param(
+            None,
+            LogEntryQuery(is_overview=True),
+            "trigger_ack_resolve",
+            "log_entries",
+            {"is_overview": "true"},
+            100,
+            ["trigger_log_entry", "acknowledge_log_entry", "resolve_log_entry"],
+            id="overview_only",
+        ),
+        pytest.param(
+            "PINCIDENT123",
+            IncidentLogEntryQuery(),
+            "trigger_ack_resolve",
+            "incidents/PINCIDENT123/log_entries",
+            {},
+            100,
+            ["trigger_log_entry", "acknowledge_log_entry", "resolve_log_entry"],
+            id="incident_basic",
+        ),
+        pytest.param(
+            "PINCIDENT123",
+            IncidentLogEntryQuery(is_overview=True, include=["incidents", "services", "channels"], limit=25),
+            "resolve",
+            "incidents/PINCIDENT123/log_entries",
+            {"is_overview": "true", "include[]": ["incidents", "services", "channels"]},
+            25,
+            ["resolve_log_entry"],
+            id="incident_with_filters",
+        ),
+        pytest.param(
+            "PINCIDENT123",
+            IncidentLogEntryQuery(since=SINCE_DATE, until=UNTIL_DATE),
+            "resolve",
+            "incidents/PINCIDENT123/log_entries",
+            {
+                "since": SINCE_ISO,
+                "until": UNTIL_ISO,
+                "time_zone": "UTC",
             },
-        }
-
-    @patch("pagerduty_mcp.tools.log_entries.get_client")
-    @patch("pagerduty_mcp.tools.log_entries.paginate")
-    def test_list_log_entries_basic(self, mock_paginate, mock_get_client):
-        """Test basic log entries listing."""
-        # Setup mocks
-        mock_paginate.return_value = [self.sample_log_entry_data]
-
-        # Test with basic query
-        query = LogEntryQuery()
-        result = list_log_entries(query)
-
-        # Assertions
-        self.assertIsInstance(result, ListResponseModel)
-        self.assertEqual(len(result.response), 1)
-        self.assertIsInstance(result.response[0], LogEntry)
-        self.assertEqual(result.response[0].id, "LOGENTRY123")
-        self.assertEqual(result.response[0].type, "resolve_log_entry")
-
-        # Verify paginate was called with correct parameters
-        mock_paginate.assert_called_once()
-        call_args = mock_paginate.call_args
-        self.assertEqual(call_args[1]["entity"], "log_entries")
-        self.assertEqual(call_args[1]["maximum_records"], 100)
-
-    @patch("pagerduty_mcp.tools.log_entries.get_client")
-    @patch("pagerduty_mcp.tools.log_entries.paginate")
-    def test_list_log_entries_with_filters(self, mock_paginate, mock_get_client):
-        """Test listing log entries with various filters."""
-        # Setup mocks
-        mock_paginate.return_value = [
-            self.sample_log_entry_data,
-            self.sample_trigger_log_entry_data,
-            self.sample_acknowledge_log_entry_data,
+            100,
+            ["resolve_log_entry"],
+            id="incident_time_range",
+        ),
+        pytest.param(
+            "PINCIDENT999",
+            IncidentLogEntryQuery(),
+            "empty",
+            "incidents/PINCIDENT999/log_entries",
+            EXPECTED_DEFAULT_PARAMS,
+            100,
+            [],
+            id="incident_empty",
+        ),
+    ],
+    indirect=["paginate_return"],
+)
+def test_list_log_entries(
+    patch_client,
+    parsed_log_entries,
+    incident_id,
+    query,
+    paginate_return,
+    expected_entity,
+    expected_params,
+    expected_max,
+    expected_types,
+):
+    """Test listing log entries across all incidents or for a single incident."""
+    patch_client.paginate.return_value = paginate_return
+
+    result = list_log_entries(query) if incident_id is None else list_incident_log_entries(incident_id, query)
+
+    _assert_list_response(result, len(expected_types))
+    assert [entry.type for entry in result.response] == expected_types
+    assert result.response == [parsed_log_entries[entry["id"]] for page in paginate_return for entry in page]
+
+    # Verify paginate was called with correct parameters
+    patch_client.paginate.assert_called_once()
+    call_args = patch_client.paginate.call_args
+    assert call_args[1]["entity"] == expected_entity
+    assert call_args[1]["maximum_records"] == expected_max
+    params = call_args[1]["params"]
+    for key, value in expected_params.items():
+        assert params[key] == value
+
+
+def test_get_log_entry_success(patch_client):
+    """Test getting a specific log entry successfully."""
+    patch_client.client.ret = RESOLVE_LOG_ENTRY
+
+    result = get_log_entry("LOGENTRY123")
+
+    assert type(result) is LogEntry
+    assert result.id == "LOGENTRY123"
+    assert result.type == "resolve_log_entry"
+    assert result.created_at == datetime(2023, 1, 1, tzinfo=UTC)
+    assert type(result.agent) is UserReference
+    assert result.agent.id == "PUSER123"
+    assert result.service.id == "PSERVICE123"
+    assert result.incident.id == "PINCIDENT123"
+    assert patch_client.client.last_path == "/log_entries/LOGENTRY123"
+
+
+def test_get_log_entry_api_error(patch_client):
+    """Test get_log_entry with API error."""
+    patch_client.client.exc = Exception("API Error: Log entry not found")
+
+    with pytest.raises(Exception, match="API Error"):
+        get_log_entry("LOGENTRY999")
+
+
+@pytest.mark.parametrize(
+    ("query", "expected", "excluded"),
+    [
+        pytest.param(
+            LogEntryQuery(
+                since=SINCE_DATE,
+                until=UNTIL_DATE,
+                is_overview=True,
+                include=["incidents", "services"],
+                limit=50,
+            ),
+            EXPECTED_FILTERED_PARAMS,
+            (),
+            id="filtered",
+        ),
+        pytest.param(
+            LogEntryQuery(),
+            EXPECTED_DEFAULT_PARAMS,
+            ("since", "until", "include[]"),
+            id="minimal",
+        ),
+        pytest.param(
+            IncidentLogEntryQuery(is_overview=True, include=["channels", "teams"], limit=75),
+            {"is_overview": "true", "include[]": ["channels", "teams"], "limit": 75, "time_zone": "UTC"},
+            (),
+            id="incident",
+        ),
+    ],
+)
+def test_query_to_params(query, expected, excluded):
+    """Test LogEntryQuery.to_params() for filtered, minimal and incident queries."""
+    params = query.to_params()
+
+    for key, value in expected.items():
+        assert params[key] == value
+    for key in excluded:
+        assert key not in params
+
+
+def test_get_log_entry_with_channel(patch_client):
+    """Test getting a log entry with channel information (notify_log_entry)."""
+    patch_client.client.ret = {
+        "id": "LOGENTRY999",
+        "type": "notify_log_entry",
+        "summary": "Notification sent",
+        "self": "https://api.pagerduty.com/log_entries/LOGENTRY999",
+        "created_at": "2023-01-01T00:00:00Z",
+        "channel": {
+            "type": "email",
+            "summary": "user@example.com",
+        },
+        "incident": {
+            "id": "PINCIDENT123",
+            "type": "incident_reference",
+            "summary": "Test Incident",
+        },
+    }
+
+    result = get_log_entry("LOGENTRY999")
+
+    assert isinstance(result, LogEntry)
+    assert result.type == "notify_log_entry"
+    assert result.channel is not None
+    assert result.channel.type == "email"
+    assert result.channel.summary == "user@example.com"
+
+
+def test_list_log_entries_multiple_types(patch_client, default_query):
+    """Test listing log entries returns various log entry types correctly."""
+    escalate_log_entry = {
+        "id": "LOGENTRY_ESC",
+        "type": "escalate_log_entry",
+        "summary": "Escalated to next level",
+        "self": "https://api.pagerduty.com/log_entries/LOGENTRY_ESC",
+        "created_at": "2023-01-01T01:00:00Z",
+        "incident": {
+            "id": "PINCIDENT123",
+            "type": "incident_reference",
+        },
+    }
+    annotate_log_entry = {
+        "id": "LOGENTRY_ANN",
+        "type": "annotate_log_entry",
+        "summary": "Note added to incident",
+        "self": "https://api.pagerduty.com/log_entries/LOGENTRY_ANN",
+        "created_at": "2023-01-01T02:00:00Z",
+        "agent": {
+            "id": "PUSER789",
+            "type": "user_reference",
+            "summary": "Annotator User",
+        },
+        "incident": {
+            "id": "PINCIDENT123",
+            "type": "incident_reference",
+        },
+    }
+    patch_client.paginate.return_value = [[escalate_log_entry], [annotate_log_entry]]
+
+    result = list_log_entries(default_query)
+
+    _assert_list_response(result, 2)
+    assert result.response[0].type == "escalate_log_entry"
+    assert result.response[1].type == "annotate_log_entry"
+
+
+def test_list_log_entries_agent_types(
+    patch_client, sample_trigger_log_entry_data, sample_acknowledge_log_entry_data, default_query
+):
+    """Test that user and service agents are parsed into the matching reference type."""
+    patch_client.paginate.return_value = [[sample_trigger_log_entry_data, sample_acknowledge_log_entry_data]]
+
+    result = list_log_entries(default_query)
+
+    _assert_list_response(result, 2)
+    assert isinstance(result.response[0].agent, ServiceReference)
+    assert result.response[0].agent.type == "service_reference"
+    assert isinstance(result.response[1].agent, UserReference)
+    assert result.response[1].agent.type == "user_reference"
+
+
+@pytest.mark.parametrize("data", [RESOLVE_LOG_ENTRY, TRIGGER_LOG_ENTRY], ids=["user_agent", "service_agent"])
+def test_get_log_entry_output_matches_tool_schema(data):
+    """Test that a log entry validates against the output schema FastMCP publishes for get_log_entry."""
+    output_schema = Tool.from_function(get_log_entry).output_schema
+
+    jsonschema.validate(LogEntry.model_validate(data).model_dump(mode="json"), output_schema)
+
+
+def test_list_log_entries_with_teams_and_contexts(patch_client):
+    """Test log entries with teams and contexts fields."""
+    patch_client.paginate.return_value = [
+        [
+            {
+                "id": "LOGENTRY_FULL",
+                "type": "trigger_log_entry",
+                "summary": "Incident triggered with context",
+                "self": "https://api.pagerduty.com/log_entries/LOGENTRY_FULL",
+                "created_at": "2023-01-01T00:00:00Z",
+                "incident": {
+                    "id": "PINCIDENT123",
+                    "type": "incident_reference",
+                },
+                "teams": [
+                    {"id": "PTEAM123", "type": "team_reference", "summary": "Team A"},
+                    {"id": "PTEAM456", "type": "team_reference", "summary": "Team B"},
+                ],
+                "contexts": [
+                    {"type": "link", "href": "https://example.com/issue/123"},
+                ],
+                "event_details": {
+                    "description": "Server CPU usage critical",
+                },
+            }
         ]
-
-        # Test with filters
-        since_date = datetime(2023, 1, 1)
-        until_date = datetime(2023, 1, 31)
-        query = LogEntryQuery(
-            since=since_date,
-            until=until_date,
-            is_overview=True,
-            include=["incidents", "services"],
-            limit=50,
-        )
-        result = list_log_entries(query)
-
-        # Assertions
-        self.assertIsInstance(result, ListResponseModel)
-        self.assertEqual(len(result.response), 3)
-
-        # Verify parameters were passed correctly
-        call_args = mock_paginate.call_args
-        params = call_args[1]["params"]
-        self.assertEqual(params["since"], since_date.isoformat())
-        self.assertEqual(params["until"], until_date.isoformat())
-        self.assertEqual(params["is_overview"], "true")
-        self.assertEqual(params["include[]"], ["incidents", "services"])
-        self.assertEqual(params["time_zone"], "UTC")
-        self.assertEqual(call_args[1]["maximum_records"], 50)
-
-    @patch("pagerduty_mcp.tools.log_entries.get_client")
-    @patch("pagerduty_mcp.tools.log_entries.paginate")
-    def test_list_log_entries_overview_only(self, mock_paginate, mock_get_client):
-        """Test listing log entries with overview flag (triggers, acks, resolves only)."""
-        # Setup mocks
-        mock_paginate.return_value = [
-            self.sample_trigger_log_entry_data,
-            self.sample_acknowledge_log_entry_data,
-            self.sample_log_entry_data,
+    ]
+
+    result = list_log_entries(LogEntryQuery(include=["teams"]))
+
+    _assert_list_response(result, 1)
+    entry = result.response[0]
+    assert entry.teams is not None
+    assert len(entry.teams) == 2
+    assert entry.contexts is not None
+    assert entry.event_details is not None
+
+
+def test_list_log_entries_keeps_undeclared_fields(patch_client, default_query):
+    """Test that fields specific to a log entry type are kept in the tool output."""
+    patch_client.paginate.return_value = [
+        [
+            {
+                "id": "LOGENTRY_ASSIGN",
+                "type": "assign_log_entry",
+                "summary": "Assigned to Test User",
+                "self": "https://api.pagerduty.com/log_entries/LOGENTRY_ASSIGN",
+                "created_at": "2023-01-01T00:00:00Z",
+                "incident": {"id": "PINCIDENT123", "type": "incident_reference"},
+                "assignees": [{"id": "PUSER123", "type": "user_reference", "summary": "Test User"}],
+                "acknowledgement_timeout": 1800,
+            }
         ]
+    ]
 
-        # Test with is_overview=True
-        query = LogEntryQuery(is_overview=True)
-        result = list_log_entries(query)
-
-        # Assertions
-        self.assertEqual(len(result.response), 3)
-        entry_types = [entry.type for entry in result.response]
-        self.assertIn("trigger_log_entry", entry_types)
-        self.assertIn("acknowledge_log_entry", entry_types)
-        self.assertIn("resolve_log_entry", entry_types)
-
-        # Verify is_overview parameter was passed
-        call_args = mock_paginate.call_args
-        params = call_args[1]["params"]
-        self.assertEqual(params["is_overview"], "true")
-
-    @patch("pagerduty_mcp.tools.log_entries.get_client")
-    @patch("pagerduty_mcp.tools.log_entries.paginate")
-    def test_list_log_entries_default_limit(self, mock_paginate, mock_get_client):
-        """Test that default limit is properly set."""
-        # Setup mocks
-        mock_paginate.return_value = [self.sample_log_entry_data]
-
-        # Test without explicit limit
-        query = LogEntryQuery()
-        result = list_log_entries(query)
-
-        # Verify default limit
-        call_args = mock_paginate.call_args
-        self.assertEqual(call_args[1]["maximum_records"], 100)
-
-    @patch("pagerduty_mcp.tools.log_entries.get_client")
-    @patch("pagerduty_mcp.tools.log_entries.paginate")
-    def test_list_incident_log_entries_basic(self, mock_paginate, mock_get_client):
-        """Test listing log entries for a specific incident."""
-        # Setup mocks
-        mock_paginate.return_value = [
-            self.sample_trigger_log_entry_data,
-            self.sample_acknowledge_log_entry_data,
-            self.sample_log_entry_data,
-        ]
+    result = list_log_entries(default_query)
+
+    _assert_list_response(result, 1)
+    dumped = result.response[0].model_dump()
+    assert dumped["assignees"] == [{"id": "PUSER123", "type": "user_reference", "summary": "Test User"}]
+    assert dumped["acknowledgement_timeout"] == 1800
 
-        # Test
-        query = IncidentLogEntryQuery()
-        result = list_incident_log_entries("PINCIDENT123", query)
-
-        # Assertions
-        self.assertIsInstance(result, ListResponseModel)
-        self.assertEqual(len(result.response), 3)
-        self.assertIsInstance(result.response[0], LogEntry)
-
-        # Verify correct endpoint was called
-        call_args = mock_paginate.call_args
-        self.assertEqual(call_args[1]["entity"], "incidents/PINCIDENT123/log_entries")
-        self.assertEqual(call_args[1]["maximum_records"], 100)
-
-    @patch("pagerduty_mcp.tools.log_entries.get_client")
-    @patch("pagerduty_mcp.tools.log_entries.paginate")
-    def test_list_incident_log_entries_with_filters(self, mock_paginate, mock_get_client):
-        """Test listing incident log entries with filters."""
-        # Setup mocks
-        mock_paginate.return_value = [self.sample_log_entry_data]
-
-        # Test with filters
-        query = IncidentLogEntryQuery(
-            is_overview=True,
-            include=["incidents", "services", "channels"],
-            limit=25,
-        )
-        result = list_incident_log_entries("PINCIDENT123", query)
-
-        # Assertions
-        self.assertEqual(len(result.response), 1)
-
-        # Verify parameters were passed correctly
-        call_args = mock_paginate.call_args
-        params = call_args[1]["params"]
-        self.assertEqual(params["is_overview"], "true")
-        self.assertEqual(params["include[]"], ["incidents", "services", "channels"])
-        self.assertEqual(call_args[1]["maximum_records"], 25)
-
-    @patch("pagerduty_mcp.tools.log_entries.get_client")
-    @patch("pagerduty_mcp.tools.log_entries.paginate")
-    def test_list_incident_log_entries_time_range(self, mock_paginate, mock_get_client):
-        """Test listing incident log entries within a time range."""
-        # Setup mocks
-        mock_paginate.return_value = [self.sample_log_entry_data]
-
-        # Test with time range
-        since_date = datetime(2023, 1, 1)
-        until_date = datetime(2023, 1, 2)
-        query = IncidentLogEntryQuery(since=since_date, until=until_date)
-        result = list_incident_log_entries("PINCIDENT123", query)
-
-        # Verify time parameters were passed
-        call_args = mock_paginate.call_args
-        params = call_args[1]["params"]
-        self.assertEqual(params["since"], since_date.isoformat())
-        self.assertEqual(params["until"], until_date.isoformat())
-        self.assertEqual(params["time_zone"], "UTC")
-
-    @patch("pagerduty_mcp.tools.log_entries.get_client")
-    def test_get_log_entry_success(self, mock_get_client):
-        """Test getting a specific log entry successfully."""
-        # Setup mock
-        mock_client = Mock()
-        mock_client.rget.return_value = self.sample_log_entry_data
-        mock_get_client.return_value = mock_client
-
-        # Test
-        result = get_log_entry("LOGENTRY123")
-
-        # Assertions
-        self.assertIsInstance(result, LogEntry)
-        self.assertEqual(result.id, "LOGENTRY123")
-        self.assertEqual(result.type, "resolve_log_entry")
-        self.assertEqual(result.agent.id, "PUSER123")
-        self.assertEqual(result.incident.id, "PINCIDENT123")
-        mock_client.rget.assert_called_once_with("/log_entries/LOGENTRY123")
-
-    @patch("pagerduty_mcp.tools.log_entries.get_client")
-    def test_get_log_entry_api_error(self, mock_get_client):
-        """Test get_log_entry with API error."""
-        # Setup mock to raise exception
-        mock_client = Mock()
-        mock_client.rget.side_effect = Exception("API Error: Log entry not found")
-        mock_get_client.return_value = mock_client
-
-        # Test that exception is raised
-        with self.assertRaises(Exception) as context:
-            get_log_entry("LOGENTRY999")
-
-        self.assertIn("API Error", str(context.exception))
-
-    @patch("pagerduty_mcp.tools.log_entries.get_client")
-    @patch("pagerduty_mcp.tools.log_entries.paginate")
-    def test_list_log_entries_empty_result(self, mock_paginate, mock_get_client):
-        """Test listing log entries with no results."""
-        # Setup mocks
-        mock_paginate.return_value = []
-
-        # Test
-        query = LogEntryQuery()
-        result = list_log_entries(query)
-
-        # Assertions
-        self.assertIsInstance(result, ListResponseModel)
-        self.assertEqual(len(result.response), 0)
-
-    @patch("pagerduty_mcp.tools.log_entries.get_client")
-    @patch("pagerduty_mcp.tools.log_entries.paginate")
-    def test_list_incident_log_entries_empty_result(self, mock_paginate, mock_get_client):
-        """Test listing incident log entries with no results."""
-        # Setup mocks
-        mock_paginate.return_value = []
-
-        # Test
-        query = IncidentLogEntryQuery()
-        result = list_incident_log_entries("PINCIDENT999", query)
-
-        # Assertions
-        self.assertIsInstance(result, ListResponseModel)
-        self.assertEqual(len(result.response), 0)
-
-    def test_log_entry_query_to_params(self):
-        """Test LogEntryQuery.to_params() method."""
-        since_date = datetime(2023, 1, 1)
-        until_date = datetime(2023, 1, 31)
-        query = LogEntryQuery(
-            since=since_date,
-            until=until_date,
-            is_overview=True,
-            include=["incidents", "services"],
-            limit=50,
-        )
-
-        params = query.to_params()
-
-        self.assertEqual(params["since"], since_date.isoformat())
-        self.assertEqual(params["until"], until_date.isoformat())
-        self.assertEqual(params["is_overview"], "true")
-        self.assertEqual(params["include[]"], ["incidents", "services"])
-        self.assertEqual(params["limit"], 50)
-        self.assertEqual(params["time_zone"], "UTC")
-
-    def test_log_entry_query_to_params_minimal(self):
-        """Test LogEntryQuery.to_params() with minimal parameters."""
-        query = LogEntryQuery()
-        params = query.to_params()
-
-        self.assertEqual(params["time_zone"], "UTC")
-        self.assertEqual(params["is_overview"], "false")
-        self.assertNotIn("since", params)
-        self.assertNotIn("until", params)
-        self.assertNotIn("include[]", params)
-
-    def test_incident_log_entry_query_to_params(self):
-        """Test IncidentLogEntryQuery.to_params() method."""
-        query = IncidentLogEntryQuery(
-            is_overview=True,
-            include=["channels", "teams"],
-            limit=75,
-        )
-
-        params = query.to_params()
-
-        self.assertEqual(params["is_overview"], "true")
-        self.assertEqual(params["include[]"], ["channels", "teams"])
-        self.assertEqual(params["limit"], 75)
-        self.assertEqual(params["time_zone"], "UTC")
-
-    @patch("pagerduty_mcp.tools.log_entries.get_client")
-    def test_get_log_entry_with_channel(self, mock_get_client):
-        """Test getting a log entry with channel information (notify_log_entry)."""
-        # Setup mock with channel data
-        log_entry_with_channel = {
-            "id": "LOGENTRY999",
-            "type": "notify_log_entry",
-            "summary": "Notification sent",
-            "self": "https://api.pagerduty.com/log_entries/LOGENTRY999",
-            "created_at": "2023-01-01T00:00:00Z",
-            "channel": {
-                "type": "email",
-                "summary": "user@example.com",
-            },
-            "incident": {
-                "id": "PINCIDENT123",
-                "type": "incident_reference",
-                "summary": "Test Incident",
-            },
-        }
-
-        mock_client = Mock()
-        mock_client.rget.return_value = log_entry_with_channel
-        mock_get_client.return_value = mock_client
-
-        # Test
-        result = get_log_entry("LOGENTRY999")
-
-        # Assertions
-        self.assertIsInstance(result, LogEntry)
-        self.assertEqual(result.type, "notify_log_entry")
-        self.assertIsNotNone(result.channel)
-        self.assertEqual(result.channel.type, "email")
-        self.assertEqual(result.channel.summary, "user@example.com")
-
-    @patch("pagerduty_mcp.tools.log_entries.get_client")
-    @patch("pagerduty_mcp.tools.log_entries.paginate")
-    def test_list_log_entries_multiple_types(self, mock_paginate, mock_get_client):
-        """Test listing log entries returns various log entry types correctly."""
-        # Setup mocks with different log entry types
-        escalate_log_entry = {
-            "id": "LOGENTRY_ESC",
-            "type": "escalate_log_entry",
-            "summary": "Escalated to next level",
-            "self": "https://api.pagerduty.com/log_entries/LOGENTRY_ESC",
-            "created_at": "2023-01-01T01:00:00Z",
-            "incident": {
-                "id": "PINCIDENT123",
-                "type": "incident_reference",
-            },
-        }
-
-        annotate_log_entry = {
-            "id": "LOGENTRY_ANN",
-            "type": "annotate_log_entry",
-            "summary": "Note added to incident",
-            "self": "https://api.pagerduty.com/log_entries/LOGENTRY_ANN",
-            "created_at": "2023-01-01T02:00:00Z",
-            "agent": {
-                "id": "PUSER789",
-                "type": "user_reference",
-                "summary": "Annotator User",
-            },
-            "incident": {
-                "id": "PINCIDENT123",
-                "type": "incident_reference",
-            },
-        }
-
-        mock_paginate.return_value = [escalate_log_entry, annotate_log_entry]
-
-        # Test
-        query = LogEntryQuery()
-        result = list_log_entries(query)
-
-        # Assertions
-        self.assertEqual(len(result.response), 2)
-        self.assertEqual(result.response[0].type, "escalate_log_entry")
-        self.assertEqual(result.response[1].type, "annotate_log_entry")
-
-    @patch("pagerduty_mcp.tools.log_entries.get_client")
-    @patch("pagerduty_mcp.tools.log_entries.paginate")
-    def test_list_log_entries_with_teams_and_contexts(self, mock_paginate, mock_get_client):
-        """Test log entries with teams and contexts fields."""
-        # Setup mock with teams and contexts
-        log_entry_with_extras = {
-            "id": "LOGENTRY_FULL",
-            "type": "trigger_log_entry",
-            "summary": "Incident triggered with context",
-            "self": "https://api.pagerduty.com/log_entries/LOGENTRY_FULL",
-            "created_at": "2023-01-01T00:00:00Z",
-            "incident": {
-                "id": "PINCIDENT123",
-                "type": "incident_reference",
-            },
-            "teams": [
-                {"id": "PTEAM123", "type": "team_reference", "summary": "Team A"},
-                {"id": "PTEAM456", "type": "team_reference", "summary": "Team B"},
-            ],
-            "contexts": [
-                {"type": "link", "href": "https://example.com/issue/123"},
-            ],
-            "event_details": {
-                "description": "Server CPU usage critical",
-            },
-        }
 
-        mock_paginate.return_value = [log_entry_with_extras]
+def test_list_log_entries_invalid_reference(patch_client, default_query):
+    """Test that a malformed reference is reported against the entry that carries it."""
+    patch_client.paginate.return_value = [[{**RESOLVE_LOG_ENTRY, "incident": {"id": ["PINCIDENT123"]}}]]
 
-        # Test
-        query = LogEntryQuery(include=["teams"])
-        result = list_log_entries(query)
+    with pytest.raises(ValidationError) as exc_info:
+        list_log_entries(default_query)
 
-        # Assertions
-        self.assertEqual(len(result.response), 1)
-        entry = result.response[0]
-        self.assertIsNotNone(entry.teams)
-        self.assertEqual(len(entry.teams), 2)
-        self.assertIsNotNone(entry.contexts)
-        self.assertIsNotNone(entry.event_details)
+    assert exc_info.value.errors()[0]["loc"] == (0, "incident", "id")
 
 
-if __name__ == "__main__":
-    unittest.main()
+@pytest.mark.parametrize("created_at", ["20230101T000000", "2023-W01-1"])
+def test_log_entry_rejects_non_rfc3339_created_at(created_at):
+    """Test that created_at only accepts the timestamp formats pydantic parses."""
+    with pytest.raises(ValidationError):
+        LogEntry.model_validate({**RESOLVE_LOG_ENTRY, "created_at": created_at})
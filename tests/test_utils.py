@@ -0,0 +1,92 @@
+import unittest
+
+from pagerduty_mcp.utils import paginate, paginate_iter
+
+
+class FakeClient:
+    """Client whose iter_all yields a fixed number of records and counts how many were pulled."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.pulled = 0
+        self.calls = []
+
+    def iter_all(self, entity, params=None):
+        self.calls.append((entity, params))
+        for i in range(self.total):
+            self.pulled += 1
+            yield {"id": f"R{i}"}
+
+
+class TestPaginateIter(unittest.TestCase):
+    """Test cases for paginate_iter."""
+
+    def test_splits_results_into_pages(self):
+        """Test that results are yielded in lists of at most page_size records."""
+        client = FakeClient(7)
+
+        pages = list(
+            paginate_iter(client=client, entity="log_entries", params={"limit": 7}, maximum_records=100, page_size=3)
+        )
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual([record["id"] for page in pages for record in page], [f"R{i}" for i in range(7)])
+        self.assertEqual(client.calls, [("log_entries", {"limit": 7})])
+
+    def test_stops_at_maximum_records_on_page_boundary(self):
+        """Test that a maximum landing on a page boundary yields only full pages."""
+        client = FakeClient(10)
+
+        pages = list(paginate_iter(client=client, entity="log_entries", params={}, maximum_records=6, page_size=3))
+
+        self.assertEqual([len(page) for page in pages], [3, 3])
+        self.assertEqual(client.pulled, 6)
+
+    def test_stops_at_maximum_records_mid_page(self):
+        """Test that a maximum inside a page yields the partial page and stops."""
+        client = FakeClient(10)
+
+        pages = list(paginate_iter(client=client, entity="log_entries", params={}, maximum_records=5, page_size=3))
+
+        self.assertEqual([len(page) for page in pages], [3, 2])
+        self.assertEqual(client.pulled, 5)
+
+    def test_empty_result(self):
+        """Test that no pages are yielded when the API returns nothing."""
+        client = FakeClient(0)
+
+        pages = list(paginate_iter(client=client, entity="log_entries", params={}))
+
+        self.assertEqual(pages, [])
+
+    def test_pulls_records_lazily(self):
+        """Test that records are only pulled from the API as pages are consumed."""
+        client = FakeClient(10)
+
+        pages = paginate_iter(client=client, entity="log_entries", params={}, maximum_records=10, page_size=4)
+
+        self.assertEqual(client.pulled, 0)
+        self.assertEqual(len(next(pages)), 4)
+        self.assertEqual(client.pulled, 4)
+
+
+class TestPaginate(unittest.TestCase):
+    """Test cases for paginate."""
+
+    def test_returns_flat_list_up_to_maximum_records(self):
+        """Test that paginate flattens the pages and stops at maximum_records."""
+        client = FakeClient(10)
+
+        results = paginate(client=client, entity="teams", params={"limit": 5}, maximum_records=5)
+
+        self.assertEqual(results, [{"id": f"R{i}"} for i in range(5)])
+        self.assertEqual(client.pulled, 5)
+        self.assertEqual(client.calls, [("teams", {"limit": 5})])
+
+    def test_empty_result(self):
+        """Test that paginate returns an empty list when the API returns nothing."""
+        self.assertEqual(paginate(client=FakeClient(0), entity="teams", params={}), [])
+
+
+if __name__ == "__main__":
+    unittest.main()